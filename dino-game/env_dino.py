@@ -2,6 +2,104 @@
 import gymnasium as gym
 from gymnasium import spaces
 import numpy as np
+from numba import njit
+
+# Capacity of the obstacle arrays. Obstacles spawn at least 0.7 screen widths
+# apart, so only a handful are ever alive at the same time.
+MAX_OBSTACLES = 8
+
+# Number of uniform [0, 1) samples drawn from np_random in one go for
+# obstacle spawning (two per spawn)
+RAND_BATCH_SIZE = 1024
+
+
+@njit(cache=True, fastmath=True)
+def _step_core(
+        ox, ow, opassed, n,
+        dino_y, dino_vy, speed, action,
+        gravity, jump_v, max_fall,
+        ground_y, ground_top, dino_h, dino_x, dino_right,
+        obs_top, spawn_trigger_x,
+):
+    """
+    Numeric part of DinoEnv.step: dino physics, obstacle movement, pruning of
+    off-screen obstacles, pass rewards and collision detection.
+
+    The obstacle arrays (x, width, passed) are updated and compacted in place.
+    Returns (n, dino_y, dino_vy, reward, n_passed, terminated, need_spawn).
+    """
+    # --- Apply action ---
+    # on_ground when the dino's top is at (or below) the ground-top
+    # position. Since y grows downwards, being "on ground" means the
+    # dino's y is greater-or-equal to the ground top position.
+    if action == 1 and dino_y >= ground_top - 1:
+        # apply negative upward velocity to jump
+        dino_vy = jump_v
+
+    # --- Physics update ---
+    # integrate gravity (positive gravity pulls down, increasing y)
+    dino_vy += gravity
+    # clamp fall speed (positive is downward)
+    if dino_vy > max_fall:
+        dino_vy = max_fall
+
+    # integrate velocity into position (negative vy moves up)
+    dino_y += dino_vy
+
+    # Clamp dino to ground (no double jump). If the dino moved below
+    # the ground-top position (greater y), snap it back and zero vy.
+    if dino_y > ground_top:
+        dino_y = float(ground_top)
+        dino_vy = 0.0
+
+    # Prevent the dino from going above the top of the screen. Negative
+    # y would index from the end of the numpy array and cause the dino
+    # to appear wrapped-around at the bottom. Clamp to 0 and stop upward
+    # velocity when hitting the top.
+    if dino_y < 0:
+        dino_y = 0.0
+        dino_vy = 0.0
+
+    # --- Move obstacles, reward passes, collision detection (AABB) ---
+    reward = 1.0  # alive bonus per step
+    n_passed = 0
+    terminated = False
+
+    # All obstacles share the same vertical extent, so the y-overlap part of
+    # the AABB test only depends on the dino and is done once per step.
+    y_overlap = dino_y + dino_h > obs_top and dino_y < ground_y
+
+    kept = 0
+    for i in range(n):
+        ox[i] -= speed
+        x = ox[i]
+        w = ow[i]
+
+        # Drop obstacles that are off-screen by compacting the rest forward
+        if x + w <= 0:
+            continue
+
+        passed = opassed[i]
+        if not passed and x + w < dino_x:
+            passed = True
+            reward += 10.0
+            n_passed += 1
+
+        if y_overlap and dino_right > x and dino_x < x + w:
+            terminated = True
+
+        ox[kept] = x
+        ow[kept] = w
+        opassed[kept] = passed
+        kept += 1
+
+    if terminated:
+        reward -= 50.0
+
+    # Spawn new obstacle if needed (done by the caller, which owns the RNG)
+    need_spawn = kept == 0 or ox[kept - 1] < spawn_trigger_x
+
+    return kept, dino_y, dino_vy, reward, n_passed, terminated, need_spawn
 
 
 class DinoEnv(gym.Env):
@@ -67,10 +165,46 @@ class DinoEnv(gym.Env):
         self.base_speed = 1.0
         self.speed_increase = 0.001  # speed += speed_increase * step
 
+        # Derived constants, computed once instead of on every step
+        self._ground_top_for_dino = self.ground_y - self.dino_height
+        self._obs_top_y = self.ground_y - self.obstacle_height
+        self._dino_right = self.dino_x + self.dino_width
+        self._spawn_trigger_x = self.screen_width * 0.6
+        self._initial_spawn_x = self.screen_width + self.screen_width * 0.3
+        self._gap_min = self.screen_width * 0.3
+        self._gap_max = self.screen_width * 0.6
+
+        # Constant trailing arguments of _step_core, bound once so step()
+        # does not look up a dozen attributes per call
+        self._step_consts = (
+            self.gravity, self.jump_velocity, self.max_fall_speed,
+            self.ground_y, self._ground_top_for_dino, self.dino_height,
+            self.dino_x, self._dino_right,
+            self._obs_top_y, self._spawn_trigger_x,
+        )
+
+        # Rendering: reusable frame buffer and the constant row/column ranges
+        # of the ground line, the obstacles and the dino
+        self._frame_buf = np.zeros(
+            (self.screen_height, self.screen_width, 1), dtype=np.uint8
+        )
+        self._ground_rows = slice(self.ground_y, self.ground_y + 2)
+        self._obs_rows = slice(self._obs_top_y, self.ground_y)
+        self._dino_cols = slice(
+            max(0, self.dino_x), min(self.screen_width, self._dino_right)
+        )
+
         # Internal state
         self._dino_y = None
         self._dino_vy = None
-        self._obstacles = None  # list of dicts: {"x": float, "width": int}
+        # Obstacles as parallel arrays; only the first _n_obs entries are alive
+        self._ox = np.zeros(MAX_OBSTACLES, dtype=np.float32)
+        self._ow = np.zeros(MAX_OBSTACLES, dtype=np.int32)
+        self._opassed = np.zeros(MAX_OBSTACLES, dtype=np.bool_)
+        self._n_obs = 0
+        # Pre-drawn random numbers, see _next_random
+        self._rand_buf = []
+        self._rand_idx = 0
         self._speed = None
         self._steps = None
         self._score = None
@@ -80,17 +214,20 @@ class DinoEnv(gym.Env):
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
         # self.np_random is set by super().reset(seed=seed)
+        # Drop pre-drawn numbers so a reseed takes effect right away
+        self._rand_buf = []
+        self._rand_idx = 0
 
         self._steps = 0
         self._score = 0
         self._speed = self.base_speed
 
         # Dino starts on ground
-        self._dino_y = self.ground_y - self.dino_height
+        self._dino_y = float(self._ground_top_for_dino)
         self._dino_vy = 0.0
 
         # Single obstacle starting off-screen to the right
-        self._obstacles = []
+        self._n_obs = 0
         self._spawn_obstacle(initial=True)
 
         obs = self._render_frame()
@@ -101,71 +238,28 @@ class DinoEnv(gym.Env):
     def step(self, action):
         self._steps += 1
 
-        # --- Apply action ---
-        # on_ground when the dino's top is at (or below) the ground-top
-        # position. Since y grows downwards, being "on ground" means the
-        # dino's y is greater-or-equal to the ground top position.
-        on_ground = self._dino_y >= self.ground_y - self.dino_height - 1
-        if action == 1 and on_ground:
-            # apply negative upward velocity to jump
-            self._dino_vy = self.jump_velocity
-
-        # --- Physics update ---
-        # integrate gravity (positive gravity pulls down, increasing y)
-        self._dino_vy += self.gravity
-        # clamp fall speed (positive is downward)
-        if self._dino_vy > self.max_fall_speed:
-            self._dino_vy = self.max_fall_speed
-
-        # integrate velocity into position (negative vy moves up)
-        self._dino_y += self._dino_vy
-
-        # Clamp dino to ground (no double jump). If the dino moved below
-        # the ground-top position (greater y), snap it back and zero vy.
-        if self._dino_y > self.ground_y - self.dino_height:
-            self._dino_y = self.ground_y - self.dino_height
-            self._dino_vy = 0.0
-
-        # Prevent the dino from going above the top of the screen. Negative
-        # y would index from the end of the numpy array and cause the dino
-        # to appear wrapped-around at the bottom. Clamp to 0 and stop upward
-        # velocity when hitting the top.
-        if self._dino_y < 0:
-            self._dino_y = 0
-            self._dino_vy = 0.0
-
-        # --- Move obstacles ---
         self._speed += self.speed_increase
-        dx = self._speed
-        for obs in self._obstacles:
-            obs["x"] -= dx
 
-        # Remove obstacles that are off-screen
-        self._obstacles = [o for o in self._obstacles if o["x"] + o["width"] > 0]
+        (
+            self._n_obs,
+            self._dino_y,
+            self._dino_vy,
+            reward,
+            n_passed,
+            terminated,
+            need_spawn,
+        ) = _step_core(
+            self._ox, self._ow, self._opassed, self._n_obs,
+            self._dino_y, self._dino_vy, self._speed, int(action),
+            *self._step_consts,
+        )
+        self._score += n_passed
 
-        # Spawn new obstacle if needed
-        if len(self._obstacles) == 0 or (
-                self._obstacles[-1]["x"] < self.screen_width * 0.6
-        ):
+        if need_spawn:
             self._spawn_obstacle()
 
-        # --- Reward + termination ---
-        reward = 1.0  # alive bonus per step
-        terminated = False
         truncated = self._steps >= self.max_steps
 
-        # Reward for passing obstacles
-        for obs in self._obstacles:
-            if not obs.get("passed", False) and obs["x"] + obs["width"] < self.dino_x:
-                obs["passed"] = True
-                reward += 10.0
-                self._score += 1
-
-        # Collision detection (AABB)
-        if self._check_collision():
-            reward -= 50.0
-            terminated = True
-
         obs = self._render_frame()
         info = {
             "score": self._score,
@@ -182,8 +276,12 @@ class DinoEnv(gym.Env):
         """
         if self.render_mode == "rgb_array":
             frame = self._render_frame()
-            # Convert 1-channel grayscale to 3-channel RGB for gym-style rgb_array
-            rgb = np.repeat(frame, 3, axis=2)
+            # Convert 1-channel grayscale to 3-channel RGB for gym-style
+            # rgb_array. Broadcasting gives a read-only view instead of
+            # writing the frame three times.
+            rgb = np.broadcast_to(
+                frame, (self.screen_height, self.screen_width, 3)
+            )
             return rgb
         else:
             # You can plug in cv2.imshow or pygame here if you really want human mode
@@ -199,92 +297,70 @@ class DinoEnv(gym.Env):
         Spawn an obstacle to the right.
         If initial=True, spawn a bit further away.
         """
-        width = int(
-            self.np_random.integers(
-                self.obstacle_min_width, self.obstacle_max_width + 1
-            )
+        # Uniform integer in [obstacle_min_width, obstacle_max_width]
+        width = self.obstacle_min_width + int(
+            self._next_random()
+            * (self.obstacle_max_width - self.obstacle_min_width + 1)
         )
 
         if initial:
-            x = self.screen_width + self.screen_width * 0.3
+            x = self._initial_spawn_x
         else:
             # Spawn at some random gap beyond the right edge
-            gap_min = self.screen_width * 0.3
-            gap_max = self.screen_width * 0.6
-            gap = float(self.np_random.uniform(gap_min, gap_max))
+            gap = self._gap_min + self._next_random() * (self._gap_max - self._gap_min)
             x = self.screen_width + gap
 
-        self._obstacles.append(
-            {
-                "x": float(x),
-                "width": width,
-                "passed": False,
-            }
-        )
+        i = self._n_obs
+        self._ox[i] = x
+        self._ow[i] = width
+        self._opassed[i] = False
+        self._n_obs = i + 1
 
-    def _check_collision(self):
+    def _next_random(self):
         """
-        Axis-aligned bounding-box (AABB) collision between dino and obstacles.
+        Next uniform [0, 1) sample. Samples are drawn from np_random in
+        batches of RAND_BATCH_SIZE instead of one Generator call per number.
         """
-        dino_left = self.dino_x
-        dino_right = self.dino_x + self.dino_width
-        dino_top = self._dino_y
-        dino_bottom = self._dino_y + self.dino_height
-
-        for obs in self._obstacles:
-            obs_left = obs["x"]
-            obs_right = obs["x"] + obs["width"]
-            obs_top = self.ground_y - self.obstacle_height
-            obs_bottom = self.ground_y
-
-            # AABB overlap
-            if (
-                    dino_right > obs_left
-                    and dino_left < obs_right
-                    and dino_bottom > obs_top
-                    and dino_top < obs_bottom
-            ):
-                return True
-
-        return False
+        if self._rand_idx >= len(self._rand_buf):
+            self._rand_buf = self.np_random.random(RAND_BATCH_SIZE).tolist()
+            self._rand_idx = 0
+        r = self._rand_buf[self._rand_idx]
+        self._rand_idx += 1
+        return r
 
     def _render_frame(self):
         """
         Renders a simple 2D scene to a grayscale image (H, W, 1) uint8.
         White = 255, black = 0.
+
+        Drawing happens in a buffer that is reused across steps; the returned
+        frame is a copy, since vec envs keep the terminal observation around
+        while the env is reset in place.
         """
-        img = np.zeros(
-            (self.screen_height, self.screen_width), dtype=np.uint8
-        )
+        img = self._frame_buf
+        img.fill(0)
 
         # Ground line
-        img[self.ground_y : self.ground_y + 2, :] = 255
+        img[self._ground_rows] = 255
 
         # Dino rectangle (clamped to image bounds to avoid numpy negative
         # indexing/wrap-around)
         dino_top = int(self._dino_y)
         dino_bottom = int(self._dino_y + self.dino_height)
-        dino_left = self.dino_x
-        dino_right = self.dino_x + self.dino_width
         dino_top_clamp = max(0, dino_top)
         dino_bottom_clamp = min(self.screen_height, dino_bottom)
-        dino_left_clamp = max(0, dino_left)
-        dino_right_clamp = min(self.screen_width, dino_right)
-        if dino_bottom_clamp > dino_top_clamp and dino_right_clamp > dino_left_clamp:
-            img[dino_top_clamp:dino_bottom_clamp, dino_left_clamp:dino_right_clamp] = 255
-
-        # Obstacles
-        for obs in self._obstacles:
-            x1 = int(obs["x"])
-            x2 = int(obs["x"] + obs["width"])
-            y1 = self.ground_y - self.obstacle_height
-            y2 = self.ground_y
-            if x2 <= 0 or x1 >= self.screen_width:
-                continue
-            x1_clamp = max(0, x1)
-            x2_clamp = min(self.screen_width, x2)
-            img[y1:y2, x1_clamp:x2_clamp] = 255
-
-        # Add channel dimension
-        img = img[..., None]
-        return img
+        if dino_bottom_clamp > dino_top_clamp:
+            img[dino_top_clamp:dino_bottom_clamp, self._dino_cols] = 255
+
+        # Obstacles (pulled out as Python scalars in one go, cheaper than
+        # indexing the arrays element by element)
+        n = self._n_obs
+        obs_rows = self._obs_rows
+        screen_w = self.screen_width
+        for x, w in zip(self._ox[:n].tolist(), self._ow[:n].tolist()):
+            x1 = max(0, int(x))
+            x2 = min(screen_w, int(x + w))
+            if x2 > x1:
+                img[obs_rows, x1:x2] = 255
+
+        return img.copy()
@@ -2,7 +2,9 @@ import argparse
 import time
 
 import cv2
+import torch
 from stable_baselines3 import PPO
+from stable_baselines3.common.atari_wrappers import MaxAndSkipEnv
 
 from env_dino import DinoEnv
 
@@ -68,11 +70,24 @@ def run_manual():
     cv2.destroyAllWindows()
 
 
-def run_agent(model_path: str):
+def run_agent(model_path: str, frame_skip: int = 1):
     print(f"Loading agent from: {model_path}")
     model = PPO.load(model_path, device="cpu")  # CPU is enough for inference here
 
     env = make_env(render_mode="rgb_array")
+    if frame_skip > 1:
+        # must match the frame skip the agent was trained with
+        env = MaxAndSkipEnv(env, skip=frame_skip)
+
+    # Query the policy directly instead of model.predict, which re-checks
+    # the observation and builds a new tensor from it on every call. The
+    # policy was trained on channel-first frames (VecTransposeImage) and does
+    # the uint8 -> float /255 scaling itself.
+    policy = model.policy
+    policy.set_training_mode(False)
+    height, width, _ = env.observation_space.shape
+    obs_tensor = torch.zeros((1, 1, height, width), dtype=torch.uint8)
+
     obs, info = env.reset()
     window_name = "Dino - Agent (Q to quit)"
     cv2.namedWindow(window_name)
@@ -89,9 +104,9 @@ def run_agent(model_path: str):
             break
 
         # Agent action
-        action, _ = model.predict(obs, deterministic=True)
-        # Stable Baselines3 returns numpy scalar / array, cast to int
-        action = int(action)
+        obs_tensor[0, 0].copy_(torch.from_numpy(obs[:, :, 0]))
+        with torch.no_grad():
+            action = int(policy.get_distribution(obs_tensor).mode())
 
         obs, reward, terminated, truncated, info = env.step(action)
         done = terminated or truncated
@@ -103,7 +118,8 @@ def run_agent(model_path: str):
             episode_reward = 0.0
             obs, info = env.reset()
 
-        time.sleep(1.0 / 60.0)
+        # keep game speed the same regardless of how many frames a step covers
+        time.sleep(frame_skip / 60.0)
 
     env.close()
     cv2.destroyAllWindows()
@@ -123,13 +139,21 @@ def main():
         default="ppo_dino_cnn.zip",
         help="Path to trained PPO model (.zip) when using --mode agent",
     )
+    parser.add_argument(
+        "--frame-skip",
+        type=int,
+        default=1,
+        help="Physics steps per agent action when using --mode agent. "
+             "Use 4 for models trained with the current train_ppo_gpu.py; "
+             "the bundled ppo_dino_cnn.zip was trained without frame skip (1)",
+    )
 
     args = parser.parse_args()
 
     if args.mode == "manual":
         run_manual()
     else:
-        run_agent(args.model_path)
+        run_agent(args.model_path, frame_skip=args.frame_skip)
 
 
 if __name__ == "__main__":
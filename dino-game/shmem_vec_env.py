@@ -0,0 +1,140 @@
+# shmem_vec_env.py
+import multiprocessing as mp
+
+import numpy as np
+from gymnasium.vector.utils import (
+    create_shared_memory,
+    read_from_shared_memory,
+    write_to_shared_memory,
+)
+from stable_baselines3.common.env_util import is_wrapped
+from stable_baselines3.common.vec_env import SubprocVecEnv
+from stable_baselines3.common.vec_env.base_vec_env import CloudpickleWrapper, VecEnv
+
+
+def _worker(remote, parent_remote, env_fn_wrapper, index, shared_obs):
+    """
+    Same protocol as SB3's SubprocVecEnv worker, except that observations
+    returned by step/reset are written into the shared buffer instead of
+    being pickled through the pipe.
+    """
+    parent_remote.close()
+    env = env_fn_wrapper.var()
+    observation_space = env.observation_space
+    reset_info = {}
+    while True:
+        try:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                observation, reward, terminated, truncated, info = env.step(data)
+                # convert to SB3 VecEnv api
+                done = terminated or truncated
+                info["TimeLimit.truncated"] = truncated and not terminated
+                if done:
+                    # save final observation where user can get it, then reset
+                    info["terminal_observation"] = observation
+                    observation, reset_info = env.reset()
+                write_to_shared_memory(observation_space, index, observation, shared_obs)
+                remote.send((reward, done, info, reset_info))
+            elif cmd == "reset":
+                maybe_options = {"options": data[1]} if data[1] else {}
+                observation, reset_info = env.reset(seed=data[0], **maybe_options)
+                write_to_shared_memory(observation_space, index, observation, shared_obs)
+                remote.send(reset_info)
+            elif cmd == "render":
+                remote.send(env.render())
+            elif cmd == "close":
+                env.close()
+                remote.close()
+                break
+            elif cmd == "get_spaces":
+                remote.send((env.observation_space, env.action_space))
+            elif cmd == "env_method":
+                method = env.get_wrapper_attr(data[0])
+                remote.send(method(*data[1], **data[2]))
+            elif cmd == "get_attr":
+                remote.send(env.get_wrapper_attr(data))
+            elif cmd == "has_attr":
+                try:
+                    env.get_wrapper_attr(data)
+                    remote.send(True)
+                except AttributeError:
+                    remote.send(False)
+            elif cmd == "set_attr":
+                remote.send(setattr(env, data[0], data[1]))
+            elif cmd == "is_wrapped":
+                remote.send(is_wrapped(env, data))
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+        except EOFError:
+            break
+        except KeyboardInterrupt:
+            break
+
+
+class ShmemVecEnv(SubprocVecEnv):
+    """
+    SubprocVecEnv variant for image observations.
+
+    Each worker writes its observation into a shared-memory block, so only
+    rewards, dones and infos go through the pipes. This avoids pickling a
+    full frame per env per step. Terminal observations still travel in the
+    info dict, but only when an episode ends.
+
+    The observation space is read from a throwaway instance created with
+    env_fns[0] in the parent process, since the shared block has to exist
+    before the workers are started.
+    """
+
+    def __init__(self, env_fns, start_method=None):
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        dummy_env = env_fns[0]()
+        observation_space = dummy_env.observation_space
+        action_space = dummy_env.action_space
+        dummy_env.close()
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        self._shared_obs = create_shared_memory(observation_space, n=n_envs, ctx=ctx)
+        self._obs_view = read_from_shared_memory(
+            observation_space, self._shared_obs, n=n_envs
+        )
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_envs)])
+        self.processes = []
+        for index, (work_remote, remote, env_fn) in enumerate(
+                zip(self.work_remotes, self.remotes, env_fns)
+        ):
+            args = (
+                work_remote, remote, CloudpickleWrapper(env_fn), index, self._shared_obs
+            )
+            # daemon=True: if the main process crashes, we should not cause things to hang
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        VecEnv.__init__(self, n_envs, observation_space, action_space)
+
+    def step_wait(self):
+        results = [remote.recv() for remote in self.remotes]
+        self.waiting = False
+        rews, dones, infos, self.reset_infos = zip(*results)
+        # Copy out of the shared block: the caller keeps the previous batch
+        # around while the workers already write the next one.
+        return self._obs_view.copy(), np.stack(rews), np.stack(dones), infos
+
+    def reset(self):
+        for env_idx, remote in enumerate(self.remotes):
+            remote.send(("reset", (self._seeds[env_idx], self._options[env_idx])))
+        self.reset_infos = [remote.recv() for remote in self.remotes]
+        # Seeds and options are only used once
+        self._reset_seeds()
+        self._reset_options()
+        return self._obs_view.copy()
@@ -1,12 +1,19 @@
+import numpy as np
 from stable_baselines3 import PPO
+from stable_baselines3.common.atari_wrappers import MaxAndSkipEnv
 from stable_baselines3.common.monitor import Monitor
-from stable_baselines3.common.vec_env import SubprocVecEnv
+from stable_baselines3.common.vec_env import VecTransposeImage
 from env_dino import DinoEnv
+from rollout_buffer import ObsDtypeRolloutBuffer
+from shmem_vec_env import ShmemVecEnv
 
 
 def make_env(rank, base_seed=0):
     def _init():
         env = DinoEnv(render_mode=None)
+        # Atari-style frame skip: repeat each action for 4 physics steps and
+        # max-pool the last two frames, so the CNN runs 4x less per game time
+        env = MaxAndSkipEnv(env, skip=4)
         env = Monitor(env)
         env.reset(seed=base_seed + rank)
         return env
@@ -14,7 +21,18 @@ def make_env(rank, base_seed=0):
 
 if __name__ == "__main__":
     n_envs = 8
-    vec_env = SubprocVecEnv([make_env(i) for i in range(n_envs)])
+
+    # Compile DinoEnv's numba step kernel once here: it is cached on disk
+    # (cache=True), so the worker processes load it instead of each
+    # compiling it on their first step.
+    warmup_env = DinoEnv()
+    warmup_env.reset(seed=0)
+    warmup_env.step(0)
+    warmup_env.close()
+
+    # Observations stay uint8 all the way to the GPU: no float conversion in
+    # the vec env stack, and a rollout buffer that keeps the obs dtype.
+    vec_env = VecTransposeImage(ShmemVecEnv([make_env(i) for i in range(n_envs)]))
 
     model = PPO(
         "CnnPolicy",
@@ -28,7 +46,9 @@ if __name__ == "__main__":
         device="cuda",
         verbose=1,
         tensorboard_log="./logs_dino/",
+        rollout_buffer_class=ObsDtypeRolloutBuffer,
     )
+    assert model.policy.observation_space.dtype == np.uint8
 
     model.learn(total_timesteps=2_000_000)
     model.save("ppo_dino_cnn")
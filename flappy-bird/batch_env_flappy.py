@@ -0,0 +1,201 @@
+# batch_env_flappy.py
+import numpy as np
+from numba import njit
+from stable_baselines3.common.vec_env import VecEnv
+
+from env_flappy import FlappyBirdEnv
+
+
+@njit(cache=True, fastmath=True)
+def _batch_step(
+        y, v_y, pipe_x, pipe_gap_y, last_pipe_passed, score, actions, rng,
+        out_obs, out_rew, out_done, out_score, out_terminal_obs,
+        gravity, flap_impulse, pipe_speed, gap_half, max_vy, bird_x,
+):
+    """
+    One step of every game in the batch, in a single pass over the games.
+
+    Follows FlappyBirdEnv.step per game. Finished games are reset in place;
+    their last observation goes to out_terminal_obs and their final score to
+    out_score. Pipe gaps are drawn from rng, in game order.
+    """
+    for i in range(y.shape[0]):
+        # apply flap
+        if actions[i] == 1:
+            v_y[i] += flap_impulse
+
+        # physics
+        v_y[i] += gravity
+
+        # cap velocity
+        v_y[i] = min(max_vy, max(-max_vy, v_y[i]))
+
+        y[i] += v_y[i]
+
+        # move pipe
+        pipe_x[i] -= pipe_speed
+
+        reward = 0.01  # alive reward
+        done = False
+
+        # check pipe passed
+        if not last_pipe_passed[i] and pipe_x[i] < bird_x:
+            reward += 1.0
+            score[i] += 1
+            last_pipe_passed[i] = True
+
+        # respawn pipe if offscreen
+        if pipe_x[i] < 0.0:
+            pipe_x[i] = 1.0
+            pipe_gap_y[i] = rng.uniform(0.3, 0.7)
+            last_pipe_passed[i] = False
+
+        # collisions
+        if y[i] <= 0.0 or y[i] >= 1.0:
+            done = True
+
+        # check pipe collision (rough)
+        if bird_x < pipe_x[i] < bird_x + 0.05:  # in pipe column
+            if abs(y[i] - pipe_gap_y[i]) > gap_half:
+                done = True
+
+        if done:
+            reward -= 0.5  # penalty for dying
+
+        out_rew[i] = reward
+        out_done[i] = done
+        out_score[i] = score[i]
+
+        if done:
+            out_terminal_obs[i, 0] = y[i]
+            out_terminal_obs[i, 1] = v_y[i]
+            out_terminal_obs[i, 2] = min(1.0, max(0.0, pipe_x[i] - bird_x))
+            out_terminal_obs[i, 3] = pipe_gap_y[i]
+
+            # reset game, same as FlappyBirdEnv._reset_game
+            y[i] = 0.5
+            v_y[i] = 0.0
+            pipe_x[i] = 1.0
+            pipe_gap_y[i] = rng.uniform(0.1, 0.9)
+            last_pipe_passed[i] = False
+            score[i] = 0
+
+        out_obs[i, 0] = y[i]
+        out_obs[i, 1] = v_y[i]
+        out_obs[i, 2] = min(1.0, max(0.0, pipe_x[i] - bird_x))
+        out_obs[i, 3] = pipe_gap_y[i]
+
+
+class BatchFlappyEnv(VecEnv):
+    """
+    N Flappy Bird games simulated together in one process.
+
+    Same game as FlappyBirdEnv, but the state of all games is held in NumPy
+    arrays of shape (N,) and a step is one call into a compiled kernel for
+    the whole batch. Implements the SB3 VecEnv API directly, so it can be passed
+    to PPO/DQN in place of a SubprocVecEnv/DummyVecEnv of FlappyBirdEnv's.
+
+    Finished games are reset in place; like SB3's vec envs, the last
+    observation of a finished game is put into info["terminal_observation"].
+    All games draw their pipe gaps from one shared, seedable generator.
+    """
+
+    def __init__(self, n_envs, seed=None):
+        # Take spaces and physics params from the single-game env so both stay
+        # in sync
+        template = FlappyBirdEnv()
+        self.render_mode = None
+
+        self.gravity = template.gravity
+        self.flap_impulse = template.flap_impulse
+        self.pipe_speed = template.pipe_speed
+        self.gap_half = template.gap_half
+        self.max_vy = template.max_vy
+        self.bird_x = template.bird_x
+
+        self._rng = np.random.default_rng(seed)
+        self._actions = None
+
+        # state of every game, one entry per env
+        self.y = np.zeros(n_envs, dtype=np.float64)
+        self.v_y = np.zeros(n_envs, dtype=np.float64)
+        self.pipe_x = np.zeros(n_envs, dtype=np.float64)
+        self.pipe_gap_y = np.zeros(n_envs, dtype=np.float64)
+        self.last_pipe_passed = np.zeros(n_envs, dtype=np.bool_)
+        self.score = np.zeros(n_envs, dtype=np.int64)
+        # scratch for the last observation of games that end during a step
+        self._terminal_obs = np.zeros((n_envs, 4), dtype=np.float32)
+
+        super().__init__(n_envs, template.observation_space, template.action_space)
+
+    def _reset_games(self, mask):
+        n = int(np.count_nonzero(mask))
+        self.y[mask] = 0.5
+        self.v_y[mask] = 0.0
+        self.pipe_x[mask] = 1.0
+        self.pipe_gap_y[mask] = self._rng.uniform(0.1, 0.9, size=n)
+        self.last_pipe_passed[mask] = False
+        self.score[mask] = 0
+
+    def _get_obs(self):
+        obs = np.empty((self.num_envs, 4), dtype=np.float32)
+        obs[:, 0] = self.y
+        obs[:, 1] = self.v_y
+        obs[:, 2] = np.clip(self.pipe_x - self.bird_x, 0.0, 1.0)
+        obs[:, 3] = self.pipe_gap_y
+        return obs
+
+    # ------------- VecEnv API -------------
+
+    def reset(self):
+        # Seeds are only used once, see VecEnv.seed
+        if self._seeds[0] is not None:
+            self._rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+
+        self._reset_games(np.ones(self.num_envs, dtype=np.bool_))
+        self.reset_infos = [{} for _ in range(self.num_envs)]
+        return self._get_obs()
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions, dtype=np.int64)
+
+    def step_wait(self):
+        obs = np.empty((self.num_envs, 4), dtype=np.float32)
+        rewards = np.empty(self.num_envs, dtype=np.float64)
+        dones = np.empty(self.num_envs, dtype=np.bool_)
+        scores = np.empty(self.num_envs, dtype=np.int64)
+        terminal_obs = self._terminal_obs
+
+        _batch_step(
+            self.y, self.v_y, self.pipe_x, self.pipe_gap_y,
+            self.last_pipe_passed, self.score, self._actions, self._rng,
+            obs, rewards, dones, scores, terminal_obs,
+            self.gravity, self.flap_impulse, self.pipe_speed,
+            self.gap_half, self.max_vy, self.bird_x,
+        )
+
+        infos = [{"score": score} for score in scores.tolist()]
+        for i in np.flatnonzero(dones).tolist():
+            infos[i]["terminal_observation"] = terminal_obs[i].copy()
+            infos[i]["TimeLimit.truncated"] = False
+
+        return obs, rewards, dones, infos
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name) for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name, value, indices=None):
+        # all games share one object, so a value is set for every env
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False for _ in self._get_indices(indices)]
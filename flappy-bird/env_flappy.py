@@ -39,7 +39,8 @@ class FlappyBirdEnv(gym.Env):
 
     def _get_obs(self):
         pipe_dx = self.pipe_x - self.bird_x
-        pipe_dx = np.clip(pipe_dx, 0.0, 1.0)
+        # plain min/max: np.clip on a Python float costs a full ufunc call
+        pipe_dx = min(1.0, max(0.0, pipe_dx))
         return np.array([self.y, self.v_y, pipe_dx, self.pipe_gap_y], dtype=np.float32)
 
     def reset(self, seed=None, options=None):
@@ -58,7 +59,7 @@ class FlappyBirdEnv(gym.Env):
         self.v_y += self.gravity
 
         # cap velocity
-        self.v_y = np.clip(self.v_y, -self.max_vy, self.max_vy)
+        self.v_y = min(self.max_vy, max(-self.max_vy, self.v_y))
 
         self.y   += self.v_y
 
@@ -78,7 +79,7 @@ class FlappyBirdEnv(gym.Env):
         # respawn pipe if offscreen
         if self.pipe_x < 0.0:
             self.pipe_x = 1.0
-            self.pipe_gap_y = np.random.uniform(0.3, 0.7)
+            self.pipe_gap_y = self.np_random.uniform(0.3, 0.7)
             self.last_pipe_passed = False
 
         # collisions
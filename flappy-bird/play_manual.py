@@ -26,6 +26,15 @@ class FlappyBirdRenderer:
         self.GROUND_COLOR = (222, 184, 135)  # Tan
         self.GAP_COLOR = (100, 149, 237)  # Cornflower blue
         
+        # Static surfaces, created once instead of on every render call
+        self.inst_text = self.small_font.render("SPACE to flap | ESC to quit", True, (255, 255, 255))
+        self.inst_shadow = self.small_font.render("SPACE to flap | ESC to quit", True, (0, 0, 0))
+        self.game_over_overlay = pygame.Surface((width, height))
+        self.game_over_overlay.set_alpha(128)
+        self.game_over_overlay.fill((0, 0, 0))
+        self.game_over_text = self.font.render("GAME OVER", True, (255, 0, 0))
+        self.restart_text = self.small_font.render("Press R to restart | ESC to quit", True, (255, 255, 255))
+        
     def render(self, env):
         """Render the current game state"""
         self.screen.fill(self.BG_COLOR)
@@ -81,32 +90,25 @@ class FlappyBirdRenderer:
         self.screen.blit(score_text, (20, 20))
         
         # Draw instructions
-        inst_text = self.small_font.render("SPACE to flap | ESC to quit", True, (255, 255, 255))
-        inst_shadow = self.small_font.render("SPACE to flap | ESC to quit", True, (0, 0, 0))
-        self.screen.blit(inst_shadow, (22, self.height - 42))
-        self.screen.blit(inst_text, (20, self.height - 40))
+        self.screen.blit(self.inst_shadow, (22, self.height - 42))
+        self.screen.blit(self.inst_text, (20, self.height - 40))
         
         pygame.display.flip()
         
     def render_game_over(self, score):
         """Render game over screen"""
-        overlay = pygame.Surface((self.width, self.height))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.game_over_overlay, (0, 0))
         
-        game_over_text = self.font.render("GAME OVER", True, (255, 0, 0))
         score_text = self.font.render(f"Final Score: {score}", True, (255, 255, 255))
-        restart_text = self.small_font.render("Press R to restart | ESC to quit", True, (255, 255, 255))
         
-        self.screen.blit(game_over_text, 
-                        (self.width // 2 - game_over_text.get_width() // 2, 
+        self.screen.blit(self.game_over_text, 
+                        (self.width // 2 - self.game_over_text.get_width() // 2, 
                          self.height // 2 - 100))
         self.screen.blit(score_text,
                         (self.width // 2 - score_text.get_width() // 2,
                          self.height // 2 - 20))
-        self.screen.blit(restart_text,
-                        (self.width // 2 - restart_text.get_width() // 2,
+        self.screen.blit(self.restart_text,
+                        (self.width // 2 - self.restart_text.get_width() // 2,
                          self.height // 2 + 60))
         
         pygame.display.flip()
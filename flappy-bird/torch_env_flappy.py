@@ -0,0 +1,123 @@
+# torch_env_flappy.py
+import torch
+
+from env_flappy import FlappyBirdEnv
+
+
+class TorchFlappyEnv:
+    """
+    N Flappy Bird games simulated with PyTorch tensors on one device.
+
+    Same game as FlappyBirdEnv, but the state of all games lives in (N,)
+    tensors on `device`, so with device="cuda" the env runs next to the
+    policy and observations never leave the GPU. step() takes the actions
+    tensor straight from the policy and returns tensors; nothing in a step
+    synchronizes with the host.
+
+    This is not an SB3 VecEnv (those speak NumPy), see train_ppo_torch.py for
+    the training loop that uses it. Finished games are reset in place; like
+    FlappyBirdEnv, it never truncates.
+    """
+
+    def __init__(self, n_envs, device="cuda", seed=None):
+        # Take spaces and physics params from the single-game env so both stay
+        # in sync
+        template = FlappyBirdEnv()
+        self.observation_space = template.observation_space
+        self.action_space = template.action_space
+
+        self.gravity = template.gravity
+        self.flap_impulse = template.flap_impulse
+        self.pipe_speed = template.pipe_speed
+        self.gap_half = template.gap_half
+        self.max_vy = template.max_vy
+        self.bird_x = template.bird_x
+
+        self.num_envs = n_envs
+        self.device = torch.device(device)
+        self._rng = torch.Generator(device=self.device)
+        if seed is not None:
+            self._rng.manual_seed(seed)
+        else:
+            self._rng.seed()
+
+        # state of every game, one entry per env
+        self.y = torch.zeros(n_envs, device=self.device)
+        self.v_y = torch.zeros(n_envs, device=self.device)
+        self.pipe_x = torch.zeros(n_envs, device=self.device)
+        self.pipe_gap_y = torch.zeros(n_envs, device=self.device)
+        self.last_pipe_passed = torch.zeros(n_envs, dtype=torch.bool, device=self.device)
+        self.score = torch.zeros(n_envs, dtype=torch.int64, device=self.device)
+
+    def _uniform(self, low, high):
+        # one draw per game; callers pick the entries they need with a mask,
+        # which avoids a host sync to find out how many draws are needed
+        u = torch.rand(self.num_envs, generator=self._rng, device=self.device)
+        return low + (high - low) * u
+
+    def _reset_games(self, mask):
+        self.y = torch.where(mask, 0.5, self.y)
+        self.v_y = torch.where(mask, 0.0, self.v_y)
+        self.pipe_x = torch.where(mask, 1.0, self.pipe_x)
+        self.pipe_gap_y = torch.where(mask, self._uniform(0.1, 0.9), self.pipe_gap_y)
+        self.last_pipe_passed &= ~mask
+        self.score = torch.where(mask, 0, self.score)
+
+    def _get_obs(self):
+        pipe_dx = (self.pipe_x - self.bird_x).clamp(0.0, 1.0)
+        return torch.stack((self.y, self.v_y, pipe_dx, self.pipe_gap_y), dim=1)
+
+    def reset(self):
+        self._reset_games(torch.ones(self.num_envs, dtype=torch.bool, device=self.device))
+        return self._get_obs()
+
+    def step(self, actions):
+        """
+        Advance every game by one step.
+
+        Returns (obs, rewards, dones, scores): scores holds each game's score
+        at the end of this step, i.e. the final score for games that are done
+        (and have already been reset in obs).
+        """
+        # apply flap
+        self.v_y += self.flap_impulse * (actions == 1)
+
+        # physics
+        self.v_y += self.gravity
+
+        # cap velocity
+        self.v_y.clamp_(-self.max_vy, self.max_vy)
+
+        self.y += self.v_y
+
+        # move pipe
+        self.pipe_x -= self.pipe_speed
+
+        rewards = torch.full((self.num_envs,), 0.01, device=self.device)  # alive reward
+
+        # check pipe passed
+        passed = ~self.last_pipe_passed & (self.pipe_x < self.bird_x)
+        rewards += passed
+        self.score += passed
+        self.last_pipe_passed |= passed
+
+        # respawn pipe if offscreen
+        respawn = self.pipe_x < 0.0
+        self.pipe_x = torch.where(respawn, 1.0, self.pipe_x)
+        self.pipe_gap_y = torch.where(respawn, self._uniform(0.3, 0.7), self.pipe_gap_y)
+        self.last_pipe_passed &= ~respawn
+
+        # collisions, with pipe collision checked in the pipe column (rough)
+        in_pipe_column = (self.bird_x < self.pipe_x) & (self.pipe_x < self.bird_x + 0.05)
+        dones = (
+                (self.y <= 0.0)
+                | (self.y >= 1.0)
+                | (in_pipe_column & ((self.y - self.pipe_gap_y).abs() > self.gap_half))
+        )
+
+        rewards -= 0.5 * dones  # penalty for dying
+
+        scores = self.score.clone()
+        self._reset_games(dones)
+
+        return self._get_obs(), rewards, dones, scores
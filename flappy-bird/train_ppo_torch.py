@@ -0,0 +1,153 @@
+import time
+
+import torch
+import torch.nn.functional as F
+from stable_baselines3 import PPO
+
+from batch_env_flappy import BatchFlappyEnv
+from torch_env_flappy import TorchFlappyEnv
+
+# PPO with the environment on the GPU as well: rollouts are collected from a
+# TorchFlappyEnv straight into GPU tensors, so there is no CPU<->GPU copy per
+# step. SB3's PPO object still provides the policy, the optimizer and the
+# hyperparameters, and the result is saved like in train_ppo_gpu.py; only its
+# NumPy-based rollout collection and buffer are replaced by the loop below.
+
+if __name__ == "__main__":
+    n_envs = 32
+    device = "cuda"
+    total_timesteps = 10_000_000
+
+    torch.manual_seed(42)
+    env = TorchFlappyEnv(n_envs, device=device, seed=42)
+
+    policy_kwargs = dict(
+        net_arch=[512, 512],    # bigger net = more GPU work
+    )
+
+    # The batched NumPy env only provides the spaces here, it is never stepped
+    model = PPO(
+        "MlpPolicy",
+        BatchFlappyEnv(n_envs),
+        learning_rate=3e-4,
+        n_steps=2048,
+        batch_size=8192,
+        n_epochs=4,
+        gamma=0.99,
+        gae_lambda=0.95,
+        ent_coef=0.0,
+        verbose=1,
+        device=device,
+        policy_kwargs=policy_kwargs,
+    )
+    policy = model.policy
+    n_steps = model.n_steps
+    buffer_size = n_steps * n_envs
+
+    obs_buf = torch.zeros((n_steps, n_envs, 4), device=device)
+    actions_buf = torch.zeros((n_steps, n_envs), dtype=torch.int64, device=device)
+    log_probs_buf = torch.zeros((n_steps, n_envs), device=device)
+    values_buf = torch.zeros((n_steps, n_envs), device=device)
+    rewards_buf = torch.zeros((n_steps, n_envs), device=device)
+    dones_buf = torch.zeros((n_steps, n_envs), device=device)
+
+    obs = env.reset()
+    episode_returns = torch.zeros(n_envs, device=device)
+    num_timesteps = 0
+    start_time = time.time()
+
+    while num_timesteps < total_timesteps:
+        # --- Collect rollout ---
+        policy.set_training_mode(False)
+        finished_return_sum = torch.zeros((), device=device)
+        finished_score_sum = torch.zeros((), device=device)
+        finished_count = torch.zeros((), device=device)
+
+        with torch.no_grad():
+            for step in range(n_steps):
+                actions, values, log_probs = policy(obs)
+                obs_buf[step] = obs
+                actions_buf[step] = actions
+                values_buf[step] = values.flatten()
+                log_probs_buf[step] = log_probs
+
+                obs, rewards, dones, scores = env.step(actions)
+                rewards_buf[step] = rewards
+                dones_buf[step] = dones
+
+                episode_returns += rewards
+                finished_return_sum += (episode_returns * dones).sum()
+                finished_score_sum += (scores * dones).sum()
+                finished_count += dones.sum()
+                episode_returns *= ~dones
+
+            last_values = policy.predict_values(obs).flatten()
+
+        num_timesteps += buffer_size
+
+        # --- GAE (no truncation in this game, so done means terminal) ---
+        advantages = torch.zeros_like(rewards_buf)
+        last_gae_lam = torch.zeros(n_envs, device=device)
+        for step in reversed(range(n_steps)):
+            next_values = last_values if step == n_steps - 1 else values_buf[step + 1]
+            next_non_terminal = 1.0 - dones_buf[step]
+            delta = (
+                    rewards_buf[step]
+                    + model.gamma * next_values * next_non_terminal
+                    - values_buf[step]
+            )
+            last_gae_lam = (
+                    delta + model.gamma * model.gae_lambda * next_non_terminal * last_gae_lam
+            )
+            advantages[step] = last_gae_lam
+        returns = advantages + values_buf
+
+        # --- PPO update, same loss as SB3's PPO.train ---
+        policy.set_training_mode(True)
+        clip_range = model.clip_range(1.0 - num_timesteps / total_timesteps)
+        b_obs = obs_buf.reshape(buffer_size, 4)
+        b_actions = actions_buf.reshape(buffer_size)
+        b_log_probs = log_probs_buf.reshape(buffer_size)
+        b_advantages = advantages.reshape(buffer_size)
+        b_returns = returns.reshape(buffer_size)
+
+        for epoch in range(model.n_epochs):
+            permutation = torch.randperm(buffer_size, device=device)
+            for start in range(0, buffer_size, model.batch_size):
+                idx = permutation[start:start + model.batch_size]
+
+                values, log_prob, entropy = policy.evaluate_actions(b_obs[idx], b_actions[idx])
+                values = values.flatten()
+
+                advantages_mb = b_advantages[idx]
+                advantages_mb = (advantages_mb - advantages_mb.mean()) / (advantages_mb.std() + 1e-8)
+
+                ratio = torch.exp(log_prob - b_log_probs[idx])
+                policy_loss = -torch.min(
+                    advantages_mb * ratio,
+                    advantages_mb * torch.clamp(ratio, 1 - clip_range, 1 + clip_range),
+                ).mean()
+                value_loss = F.mse_loss(b_returns[idx], values)
+                entropy_loss = -torch.mean(entropy)
+
+                loss = policy_loss + model.ent_coef * entropy_loss + model.vf_coef * value_loss
+
+                policy.optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(policy.parameters(), model.max_grad_norm)
+                policy.optimizer.step()
+
+        # One host sync per rollout for logging
+        episodes = int(finished_count.item())
+        if episodes > 0:
+            mean_return = finished_return_sum.item() / episodes
+            mean_score = finished_score_sum.item() / episodes
+        else:
+            mean_return = mean_score = float("nan")
+        fps = int(num_timesteps / (time.time() - start_time))
+        print(
+            f"timesteps={num_timesteps} fps={fps} episodes={episodes} "
+            f"ep_rew_mean={mean_return:.2f} ep_score_mean={mean_score:.2f}"
+        )
+
+    model.save("ppo_flappy")
@@ -21,6 +21,11 @@ def main():
     running = True
     done = False
 
+    font = pygame.font.SysFont(None, 24)
+    # score text is only re-rendered when the score changes
+    last_score = None
+    score_img = None
+
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -52,9 +57,11 @@ def main():
         pygame.draw.rect(screen, (0, 200, 0), (pipe_x_px, gap_y_px + gap_half_px, 60, HEIGHT))
 
         # score text
-        font = pygame.font.SysFont(None, 24)
-        img = font.render(f"Score: {info.get('score', 0)}", True, (0, 0, 0))
-        screen.blit(img, (10, 10))
+        score = info.get('score', 0)
+        if score != last_score:
+            score_img = font.render(f"Score: {score}", True, (0, 0, 0))
+            last_score = score
+        screen.blit(score_img, (10, 10))
 
         pygame.display.flip()
         clock.tick(30)  # 30 FPS